@@ -1,35 +1,71 @@
-from dataclasses import dataclass, field, asdict, is_dataclass
+from dataclasses import dataclass, field, fields, asdict, is_dataclass, MISSING
 from dacite import from_dict, Config
-from typing import Literal, get_origin, List, Dict, Set, TypeVar, Union
+from dacite.exceptions import DaciteFieldError, MissingValueError, WrongTypeError
+from collections.abc import Mapping
+from typing import Any, Literal, get_args, get_origin, get_type_hints, List, Dict, Set, TypeVar, Union
 from enum import Enum
+import functools
+from itertools import repeat
+import json
+import logging
 import types
-from .sensitive_fields import SensitiveFields
+from .sensitive_fields import _SENSITIVE
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 T = TypeVar("T")
 
 _SERIALIZABLE_ADDED = "_serializable_added"
 _NULLABLE_ADDED = "_nullable_added"
 _IS_API_DTO = "_is_api_dto"
+_FROM_DICT_IMPL = "_api_dto_from_dict"
+_TO_DICT_IMPL = "_api_dto_to_dict"
+_TYPE_HINTS = "_api_dto_hints"
+_DACITE_CONFIG = "_api_dto_config"
+_FIELD_NAMES = "_api_dto_field_names"
+_SENSITIVE_PLAN = "_api_dto_sensitive_plan"
+
+# Enum members keyed by lower-cased name, per enum class
+_ENUM_LOWER_CACHE: dict[type, dict[str, Enum]] = {}
+
+# Loggers used for sensitive-field warnings, keyed by DTO class name
+_LOGGERS = {}
 
 # ------------------------------
 # Core DTO decorator
 # ------------------------------
-def api_dto(cls=None, *, optional=True, serializable=True, auto_collections=True):
+def api_dto(cls=None, *, optional=True, serializable=True, auto_collections=True, slots=False):
     """
     Combined decorator for DTO classes.
+
+    With ``slots=True`` the dataclass is generated with ``__slots__``: instances
+    are smaller and attribute access is faster, but they cannot be given new
+    attributes at runtime and are not weak-referenceable. The decorator then
+    returns a new class rather than the one it was applied to.
     """
     def wrap(cls):
         is_api_dto, has_nullable, has_serialization = _is_api_dto(cls)
 
-        if not is_api_dto and is_dataclass(cls):
-            _remove_dataclass(cls)
-
         if not is_api_dto:
-            if optional and not has_nullable:
-                cls = make_nullable(auto_collections=auto_collections)(cls)
+            nullable = optional and not has_nullable
+            nullable_types, defaults = _nullable_fields(cls, auto_collections) if nullable else ({}, {})
+
+            # An existing dataclass only has to be rebuilt if its fields change
+            # or it has to gain slots
+            if is_dataclass(cls) and (
+                nullable_types or defaults or (slots and "__slots__" not in cls.__dict__)
+            ):
+                _remove_dataclass(cls)
+
+            if nullable:
+                setattr(cls, _NULLABLE_ADDED, True)
+                _apply_nullable_fields(cls, nullable_types, defaults)
 
             if not is_dataclass(cls):
-                cls = dataclass()(cls=cls)
+                cls = dataclass(slots=slots)(cls=cls)
 
             if serializable and not has_serialization:
                 cls = add_serializable()(cls)
@@ -45,7 +81,9 @@ def api_dto(cls=None, *, optional=True, serializable=True, auto_collections=True
 def add_serializable(cls=None):
     def wrap(cls):
         setattr(cls, _SERIALIZABLE_ADDED, True)
-        
+        if is_dataclass(cls):
+            _field_names(cls)
+
         cls.to_dict = _to_dict
         cls.from_dict = classmethod(_from_dict)
         cls.from_http_request = classmethod(_from_http_request)
@@ -57,8 +95,9 @@ def add_serializable(cls=None):
 
 
 def _to_dict(self):
-    data = asdict(self)
-    _warn_sensitive_fields(self, data)
+    data = _dto_serializer(self.__class__)(self)
+    if _SENSITIVE.enabled:
+        _warn_sensitive_fields(self, data)
     return data
 
 
@@ -67,31 +106,82 @@ def _enum_hook(value, enum_type):
     if value is None:
         return None
 
+    member = _enum_member(value, enum_type)
+    if member is None:
+        raise ValueError(f"Cannot map value {value!r} to enum {enum_type.__name__}")
+    return member
+
+
+def _enum_value(value, enum_type):
+    """Enum conversion for generated code, which reports mismatches like other types."""
+    member = _enum_member(value, enum_type)
+    if member is None:
+        raise _TypeMismatch
+    return member
+
+
+def _enum_member(value, enum_type):
     # Try direct match first
     try:
         return enum_type(value)
     except Exception:
         pass
 
-    # Try uppercase matching
+    # Try case-insensitive name matching
     if isinstance(value, str):
-        for e in enum_type:
-            if e.name.lower() == value.lower():
-                return e
-
-    raise ValueError(f"Cannot map value {value!r} to enum {enum_type.__name__}")
+        members = _ENUM_LOWER_CACHE.get(enum_type)
+        if members is None:
+            members = _ENUM_LOWER_CACHE.setdefault(
+                enum_type, {name.lower(): member for name, member in enum_type.__members__.items()}
+            )
+        return members.get(value.lower())
+    return None
 
 
 def _from_dict(cls, data):
-    return from_dict(
-        cls,
-        data=data,
-        config=Config(type_hooks={
-            cls_field_type: _enum_hook
-            for cls_field_type in cls.__annotations__.values()
-            if isinstance(cls_field_type, type) and issubclass(cls_field_type, Enum)
+    deserializer = cls.__dict__.get(_FROM_DICT_IMPL)
+    if deserializer is None:
+        deserializer = _compile_from_dict(cls)
+    return deserializer(data)
+
+
+def _type_hints(cls):
+    """Resolves the type hints of ``cls`` once and caches them on the class."""
+    hints = cls.__dict__.get(_TYPE_HINTS)
+    if hints is None:
+        hints = get_type_hints(cls)
+        setattr(cls, _TYPE_HINTS, hints)
+    return hints
+
+
+def _field_names(cls):
+    """Returns the names of the dataclass fields of ``cls``, cached on the class."""
+    names = cls.__dict__.get(_FIELD_NAMES)
+    if names is None:
+        names = tuple(cls_field.name for cls_field in fields(cls))
+        setattr(cls, _FIELD_NAMES, names)
+    return names
+
+
+def _dacite_config(cls):
+    """Builds the dacite config (enum type hooks) for ``cls`` once and caches it on the class."""
+    config = cls.__dict__.get(_DACITE_CONFIG)
+    if config is None:
+        config = Config(type_hooks={
+            enum_type: functools.partial(_enum_hook, enum_type=enum_type)
+            for field_type in _type_hints(cls).values()
+            for enum_type in _enum_types(field_type)
         })
-    )
+        setattr(cls, _DACITE_CONFIG, config)
+    return config
+
+
+def _enum_types(field_type):
+    """Yields every Enum class referenced by a (possibly generic) type hint."""
+    if isinstance(field_type, type) and issubclass(field_type, Enum):
+        yield field_type
+    for arg in get_args(field_type):
+        yield from _enum_types(arg)
 
 
 async def _from_http_request(cls, request):
@@ -106,15 +196,390 @@ async def _from_http_request(cls, request):
     return cls.from_dict(data)
 
 def _to_json(self) -> str:
-    import json
-    return json.dumps(self.to_dict())
+    return _dumps(self.to_dict())
 
 def _from_json(cls, json_str: str):
-    import json
-    data = json.loads(json_str)
+    data = _loads(json_str)
     return cls.from_dict(data)
 
 
+def _json_default(obj):
+    """Encodes values neither json nor orjson handle on their own."""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, tuple):  # namedtuples
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Built once; json.dumps creates a new encoder per call when given options.
+# Compact and non-ASCII output to match orjson.
+_json_dumps = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=_json_default).encode
+
+if orjson is not None:
+    def _dumps(obj) -> str:
+        # orjson rejects ints beyond 64 bits, which the json module encodes.
+        # NaN and infinity still differ: orjson writes null where json writes NaN.
+        try:
+            return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            return _json_dumps(obj)
+
+    _loads = orjson.loads
+else:
+    _dumps = _json_dumps
+    _loads = json.loads
+
+
+# ------------------------------
+# Generated deserializer
+# ------------------------------
+class _UnsupportedType(Exception):
+    """Raised when a field type is left to dacite instead of generated code."""
+
+
+def _compile_from_dict(cls):
+    """
+    Generates a deserializer specialised to the fields of ``cls`` and caches it
+    on the class. Type hints are resolved on first use rather than at decoration
+    time so that forward references (e.g. self-referencing DTOs) work.
+    Classes with field types the generator does not understand keep using dacite.
+    """
+    hints = _type_hints(cls)
+    namespace = {
+        "cls": cls,
+        "from_dict": from_dict,
+        "Mapping": Mapping,
+        "_enum_value": _enum_value,
+        "_type_mismatch": _type_mismatch,
+        "_TypeMismatch": _TypeMismatch,
+        "DaciteFieldError": DaciteFieldError,
+        "MissingValueError": MissingValueError,
+        "WrongTypeError": WrongTypeError,
+    }
+    try:
+        # Like dacite, init=False fields are set after construction, unless frozen
+        converters = [
+            (cls_field, _value_converter(hints[cls_field.name], namespace))
+            for cls_field in fields(cls)
+            if cls_field.init or not cls.__dataclass_params__.frozen
+        ]
+    except _UnsupportedType:
+        deserializer = functools.partial(from_dict, cls, config=_dacite_config(cls))
+    else:
+        exec(_from_dict_source(converters, hints, namespace), namespace)
+        # Classes of flat fields with defaults are built by a single call,
+        # leaving the per-field code to report the error on a mismatch
+        if all(
+            cls_field.init
+            and (_has_default(cls_field) or _is_optional(hints[cls_field.name]))
+            and _is_flat_type(hints[cls_field.name])
+            for cls_field, _ in converters
+        ):
+            namespace["__checked_from_dict__"] = namespace["__from_dict__"]
+            exec(_single_call_from_dict_source(converters, namespace), namespace)
+        deserializer = namespace["__from_dict__"]
+
+    setattr(cls, _FROM_DICT_IMPL, deserializer)
+    return deserializer
+
+
+def _from_dict_source(converters, hints, namespace):
+    lines = ["def __from_dict__(data):", "    kwargs = {}"]
+    post_init = []
+    for cls_field, convert in converters:
+        name = cls_field.name
+        if not cls_field.init:
+            post_init.append((name, convert))
+            continue
+
+        lines.append(f"    if {name!r} in data:")
+        lines += _field_source(name, f"kwargs[{name!r}]", convert, hints, namespace)
+        if not _has_default(cls_field):
+            lines.append("    else:")
+            if _is_optional(hints[name]):
+                # dacite treats Optional fields as defaulting to None
+                lines.append(f"        kwargs[{name!r}] = None")
+            else:
+                lines.append(f"        raise MissingValueError({name!r})")
+
+    if not post_init:
+        lines.append("    return cls(**kwargs)")
+        return "\n".join(lines)
+
+    lines.append("    instance = cls(**kwargs)")
+    for name, convert in post_init:
+        lines.append(f"    if {name!r} in data:")
+        lines += _field_source(name, f"instance.{name}", convert, hints, namespace)
+    lines.append("    return instance")
+    return "\n".join(lines)
+
+
+def _field_source(name, target, convert, hints, namespace):
+    """Source lines assigning the converted value of ``data[name]`` to ``target``."""
+    if convert is None:
+        return [f"        {target} = data[{name!r}]"]
+
+    # Report errors the way dacite does: against the whole field, with
+    # nested field paths prefixed by this field's name
+    type_name = _add_to_namespace(namespace, hints[name])
+    return [
+        f"        value = data[{name!r}]",
+        "        try:",
+        f"            {target} = {convert('value')}",
+        "        except _TypeMismatch:",
+        f"            raise WrongTypeError(field_type={type_name}, value=value, field_path={name!r}) from None",
+        "        except DaciteFieldError as error:",
+        f"            error.update_path({name!r})",
+        "            raise",
+    ]
+
+
+def _single_call_from_dict_source(converters, namespace):
+    """
+    Source calling ``cls`` once with every field checked inline and defaults
+    filled in for missing keys, skipping the kwargs dict.
+    """
+    arguments = []
+    for cls_field, convert in converters:
+        name = cls_field.name
+        value = convert(f"data[{name!r}]") if convert else f"data[{name!r}]"
+        if cls_field.default_factory is not MISSING:
+            default = f"{_add_to_namespace(namespace, cls_field.default_factory)}()"
+        elif cls_field.default is not MISSING:
+            default = _add_to_namespace(namespace, cls_field.default)
+        else:
+            default = "None"
+        arguments.append(f"{name}=({value} if {name!r} in data else {default})")
+
+    return "\n".join([
+        "def __from_dict__(data):",
+        "    try:",
+        f"        return cls({', '.join(arguments)})",
+        "    except _TypeMismatch:",
+        "        return __checked_from_dict__(data)",
+    ])
+
+
+def _has_default(cls_field):
+    return cls_field.default is not MISSING or cls_field.default_factory is not MISSING
+
+
+def _is_optional(field_type):
+    return get_origin(field_type) in (Union, types.UnionType) and type(None) in get_args(field_type)
+
+
+# Types also accepting ints, as in PEP 484's numeric tower (and in dacite)
+_NUMERIC_TOWER = {float: (int, float), complex: (int, float, complex)}
+
+
+class _TypeMismatch(Exception):
+    """Raised by generated code when a value does not match the declared type."""
+
+
+def _type_mismatch():
+    raise _TypeMismatch
+
+
+def _value_converter(field_type, namespace, depth=0):
+    """
+    Returns a function rendering the source code that checks a JSON value
+    (given as an expression) against ``field_type`` and converts it, or None
+    if the type does not constrain the value. Mismatches raise _TypeMismatch.
+    """
+    if field_type is Any or field_type is object or isinstance(field_type, TypeVar):
+        return None
+
+    origin = get_origin(field_type)
+    args = get_args(field_type)
+
+    if origin is Union or origin is types.UnionType:
+        non_null = [arg for arg in args if arg is not type(None)]
+        if len(non_null) == 1:
+            convert = _value_converter(non_null[0], namespace, depth)
+            if convert is None:
+                return None
+        elif all(_is_plain_type(arg) for arg in non_null):
+            types_name = _add_to_namespace(
+                namespace, tuple(checked for arg in non_null for checked in _NUMERIC_TOWER.get(arg, (arg,)))
+            )
+            convert = lambda value: f"({value} if isinstance({value}, {types_name}) else _type_mismatch())"
+        else:
+            raise _UnsupportedType(field_type)
+
+        if len(non_null) == len(args):
+            return convert
+        return lambda value: f"(None if {value} is None else {convert(value)})"
+
+    if origin is Literal:
+        values_name = _add_to_namespace(namespace, args)
+        return lambda value: f"({value} if {value} in {values_name} else _type_mismatch())"
+
+    if origin is list:
+        convert = _value_converter(args[0], namespace, depth + 1) if args else None
+        if convert is None:
+            return lambda value: f"({value} if isinstance({value}, list) else _type_mismatch())"
+        item = f"_item{depth}"
+        return lambda value: (
+            f"([{convert(item)} for {item} in {value}] if isinstance({value}, list) else _type_mismatch())"
+        )
+
+    if origin is dict:
+        convert_key = _value_converter(args[0], namespace, depth + 1) if args else None
+        convert = _value_converter(args[1], namespace, depth + 1) if args else None
+        if convert_key is None and convert is None:
+            return lambda value: f"({value} if isinstance({value}, dict) else _type_mismatch())"
+        key, item = f"_key{depth}", f"_item{depth}"
+        key_source = convert_key(key) if convert_key else key
+        item_source = convert(item) if convert else item
+        return lambda value: (
+            f"({{{key_source}: {item_source} for {key}, {item} in {value}.items()}}"
+            f" if isinstance({value}, dict) else _type_mismatch())"
+        )
+
+    if origin is not None or not isinstance(field_type, type):
+        raise _UnsupportedType(field_type)
+
+    type_name = _add_to_namespace(namespace, field_type)
+
+    if issubclass(field_type, Enum):
+        return lambda value: f"_enum_value({value}, {type_name})"
+
+    if is_dataclass(field_type):
+        if getattr(field_type, _SERIALIZABLE_ADDED, False):
+            build = lambda value: f"{type_name}.from_dict({value})"
+        else:
+            build = lambda value: f"from_dict({type_name}, {value})"
+        return lambda value: (
+            f"({build(value)} if isinstance({value}, Mapping)"
+            f" else {value} if isinstance({value}, {type_name}) else _type_mismatch())"
+        )
+
+    types_name = _add_to_namespace(namespace, _NUMERIC_TOWER.get(field_type, field_type))
+    return lambda value: f"({value} if isinstance({value}, {types_name}) else _type_mismatch())"
+
+
+def _is_flat_type(field_type):
+    """Checks if converting ``field_type`` can only fail with _TypeMismatch, not in nested DTOs."""
+    if field_type is Any or field_type is object or isinstance(field_type, TypeVar):
+        return True
+    origin = get_origin(field_type)
+    if origin is Literal:
+        return True
+    if origin in (Union, types.UnionType, list, dict):
+        return all(_is_flat_type(arg) for arg in get_args(field_type))
+    return _is_plain_type(field_type)
+
+
+def _is_plain_type(field_type):
+    """Checks if a value of ``field_type`` is validated by isinstance alone."""
+    return isinstance(field_type, type) and not issubclass(field_type, Enum) and not is_dataclass(field_type)
+
+
+def _add_to_namespace(namespace, obj):
+    name = f"_ref{len(namespace)}"
+    namespace[name] = obj
+    return name
+
+# ------------------------------
+# Generated serializer
+# ------------------------------
+_ATOMIC_TYPES = frozenset((type(None), bool, int, float, complex, str, bytes))
+
+
+def _dto_serializer(cls):
+    serializer = cls.__dict__.get(_TO_DICT_IMPL)
+    if serializer is None:
+        serializer = _compile_to_dict(cls)
+    return serializer
+
+
+def _compile_to_dict(cls):
+    """
+    Generates a serializer specialised to the fields of ``cls`` and caches it
+    on the class. It does not check for sensitive fields, so nested DTOs are
+    serialized through it and only the outermost to_dict call warns.
+    """
+    hints = _type_hints(cls)
+    namespace = {"_serialize_value": _serialize_value}
+    items = [
+        f"{name!r}: {_value_serializer(hints.get(name, Any))(f'self.{name}')}"
+        for name in _field_names(cls)
+    ]
+
+    exec(f"def __to_dict__(self):\n    return {{{', '.join(items)}}}", namespace)
+    serializer = namespace["__to_dict__"]
+    setattr(cls, _TO_DICT_IMPL, serializer)
+    return serializer
+
+
+def _value_serializer(field_type):
+    """
+    Returns a function rendering the source code that serializes a field value
+    (given as an expression) declared as ``field_type``.
+    """
+    origin = get_origin(field_type)
+    args = get_args(field_type)
+
+    if origin is Union or origin is types.UnionType:
+        non_null = [arg for arg in args if arg is not type(None)]
+        if len(non_null) == 1:
+            # the container branches below already pass None through
+            return _value_serializer(non_null[0])
+        if all(_is_atomic(arg) for arg in non_null):
+            return lambda value: value
+    elif origin is list and args and _is_atomic(args[0]):
+        return lambda value: f"(list({value}) if {value}.__class__ is list else _serialize_value({value}))"
+    elif origin is dict and args and _is_atomic(args[0]) and _is_atomic(args[1]):
+        return lambda value: f"(dict({value}) if {value}.__class__ is dict else _serialize_value({value}))"
+    elif _is_atomic(field_type):
+        return lambda value: value
+
+    return lambda value: f"_serialize_value({value})"
+
+
+def _is_atomic(field_type):
+    origin = get_origin(field_type)
+    if origin is Literal:
+        return True
+    if origin is Union or origin is types.UnionType:
+        return all(_is_atomic(arg) for arg in get_args(field_type))
+    return field_type in _ATOMIC_TYPES or (isinstance(field_type, type) and issubclass(field_type, Enum))
+
+
+def _serialize_value(value):
+    """Converts a value the way dataclasses.asdict does, without deep-copying leaves."""
+    value_type = value.__class__
+    if value_type in _ATOMIC_TYPES:
+        return value
+
+    # Exact types first, subclasses are handled by the isinstance checks below
+    if value_type is list:
+        return [_serialize_value(item) for item in value]
+    if value_type is dict:
+        return {_serialize_value(key): _serialize_value(item) for key, item in value.items()}
+
+    if is_dataclass(value_type):
+        if getattr(value_type, _SERIALIZABLE_ADDED, False):
+            return _dto_serializer(value_type)(value)
+        return asdict(value)
+
+    # Like asdict, keep the type of list, tuple and dict subclasses
+    if isinstance(value, (list, tuple)):
+        items = [_serialize_value(item) for item in value]
+        # namedtuples take their fields as positional arguments
+        return value_type(*items) if hasattr(value, "_fields") else value_type(items)
+    if isinstance(value, dict):
+        items = ((_serialize_value(key), _serialize_value(item)) for key, item in value.items())
+        if hasattr(value_type, "default_factory"):
+            # defaultdict takes its factory as the first argument
+            result = value_type(value.default_factory)
+            result.update(items)
+            return result
+        return value_type(items)
+
+    return value
+
 
 # ------------------------------
 # Nullable / optional fields
@@ -129,110 +594,153 @@ def make_nullable(cls=None, *, auto_collections=True):
     return wrap(cls)
 
 def _make_nullable(cls, auto_collections=True):
-    annotations = dict(getattr(cls, "__annotations__", {}))
-    
-    for field_name, field_type in annotations.items():
+    nullable_types, defaults = _nullable_fields(cls, auto_collections)
+    return _apply_nullable_fields(cls, nullable_types, defaults)
+
+def _nullable_fields(cls, auto_collections=True):
+    """
+    Walks the annotations of ``cls`` once and returns the annotations that have
+    to be made optional and the defaults for fields that have none. Nothing is
+    changed on the class.
+    """
+    dataclass_fields = getattr(cls, "__dataclass_fields__", {})
+    nullable_types = {}
+    defaults = {}
+
+    for field_name, field_type in getattr(cls, "__annotations__", {}).items():
         # Make non-optional types optional
         if not _is_optional(field_type):
-            annotations[field_name] = field_type | None
+            nullable_types[field_name] = field_type | None
 
         # Check for unsupported types (sets)
         origin = get_origin(field_type) or field_type
         if origin is set or origin is Set:
             raise TypeError(f"Field '{field_name}' uses set, which is not supported by @dto")
 
-        # Set default value if no default exists
-        if not hasattr(cls, field_name):
+        # Set default value if no default exists; dataclasses do not keep
+        # default factories as class attributes
+        if not hasattr(cls, field_name) and (
+            field_name not in dataclass_fields or dataclass_fields[field_name].default_factory is MISSING
+        ):
             default = None
             if auto_collections:
                 if origin in (list, List):
                     default = field(default_factory=list)
                 elif origin in (dict, Dict):
                     default = field(default_factory=dict)
-            setattr(cls, field_name, default)
+            defaults[field_name] = default
+
+    return nullable_types, defaults
 
-    cls.__annotations__ = annotations
+def _apply_nullable_fields(cls, nullable_types, defaults):
+    for field_name, default in defaults.items():
+        setattr(cls, field_name, default)
+
+    if nullable_types:
+        cls.__annotations__ = {**cls.__annotations__, **nullable_types}
     return cls
 
 def _is_optional(annotation):
-    """Checks if a type annotation is Optional[T] or T | None."""
+    """
+    Checks if a type annotation is Optional[T] or T | None.
+    Only ``T | None`` and ``Optional[T]`` / ``Union[..., None]`` are recognized.
+    """
     origin = get_origin(annotation)
-    args = getattr(annotation, "__args__", ())
-
-    # Check for T | None (UnionType in Python 3.10+)
-    if origin is types.UnionType:
-        return type(None) in args
-
-    # Check for typing.Optional[T] or typing.Union[T, None]
-    if origin is None:
-        return False
-    if origin is tuple([*args]):  # fallback, rare
-        return type(None) in args
-    if origin is getattr(annotation, "__origin__", None):
-        return type(None) in args
-    if origin is getattr(annotation, "__args__", None):
-        return type(None) in args
-
-    if origin is getattr(annotation, "__origin__", None):
-        return type(None) in args
-    if origin is getattr(annotation, "__args__", None):
-        return type(None) in args
-
-    if origin is getattr(annotation, "__origin__", None):
-        return type(None) in args
-    if origin is getattr(annotation, "__args__", None):
-        return type(None) in args
-
-    if origin is getattr(annotation, "__origin__", None):
-        return type(None) in args
-    if origin is getattr(annotation, "__args__", None):
-        return type(None) in args
-
-    if origin is getattr(annotation, "__origin__", None):
-        return type(None) in args
-    if origin is getattr(annotation, "__args__", None):
-        return type(None) in args
-
-    # For normal Optional[T]
-    if origin is Union and type(None) in args:
-        return True
-
+    if origin is types.UnionType or origin is Union:
+        return type(None) in annotation.__args__
     return False
 
 def _warn_sensitive_fields(cls, data: dict):
     """
     Recursively checks the dictionary for sensitive fields and logs a warning.
     """
-    import logging
+    sensitive_fields = _SENSITIVE
+
+    if not sensitive_fields.enabled:
+        return
 
     logger_name = type(cls).__name__ if cls else "api_dto"
-    logger = logging.getLogger(logger_name)
+    logger = _get_logger(logger_name)
+    log_mode = sensitive_fields.log_mode
+    sensitive_names = sensitive_fields._SENSITIVE_FIELDS_SET
+    has_sensitive_suffix = sensitive_fields._SENSITIVE_SUFFIX_MATCH
+
+    # Top-level keys are the DTO's own fields, whose names are pre-checked;
+    # whether to descend is decided on the actual value, not the declared type
+    for key, is_sensitive in _sensitive_plan(type(cls), sensitive_names, has_sensitive_suffix):
+        if is_sensitive:
+            _report_sensitive_field(logger, logger_name, log_mode, key)
+
+        value = data[key]
+        value_type = value.__class__
+        if value_type is dict or value_type is list:
+            _check_sensitive_fields(
+                ((None, value),), logger, logger_name, log_mode, sensitive_names, has_sensitive_suffix
+            )
+
+
+def _sensitive_plan(cls, sensitive_names, has_sensitive_suffix):
+    """
+    Returns ``(name, is_sensitive)`` for each field of ``cls``. Cached on the
+    class until the SensitiveFields configuration changes.
+    """
+    cached = cls.__dict__.get(_SENSITIVE_PLAN)
+    if cached is not None and cached[0] is sensitive_names and cached[1] is has_sensitive_suffix:
+        return cached[2]
 
-    sensitive_fields = SensitiveFields()
+    plan = tuple(
+        (name, name.lower() in sensitive_names or bool(has_sensitive_suffix(name.lower())))
+        for name in _field_names(cls)
+    )
+    setattr(cls, _SENSITIVE_PLAN, (sensitive_names, has_sensitive_suffix, plan))
+    return plan
+
+
+def _get_logger(name):
+    logger = _LOGGERS.get(name)
+    if logger is None:
+        logger = _LOGGERS[name] = logging.getLogger(name)
+    return logger
 
-    if not sensitive_fields.enabled:
-        return
 
-    for key, value in data.items():
-        key_lower = key.lower()
+def _report_sensitive_field(logger, logger_name, log_mode, key):
+    if log_mode == 'warn':
+        logger.warning(f"⚠️\tWARNING: Serializing sensitive field '{logger_name}.{key}'")
+    elif log_mode == 'strict':
+        logger.error(f"❌\tERROR: Serializing sensitive field '{logger_name}.{key}'")
+        raise AttributeError(f"Invalid field name for serialization: '{logger_name}.{key}'")
 
-        # Warn if key matches known sensitive names or ends with sensitive suffix
-        if key_lower in sensitive_fields._SENSITIVE_FIELDS or key_lower.endswith(sensitive_fields._SENSITIVE_SUFFIXES):
-            if sensitive_fields.log_mode == 'warn':
-                logger.warning(f"⚠️\tWARNING: Serializing sensitive field '{logger_name}.{key}'")
-            elif sensitive_fields.log_mode == 'strict':
-                logger.error(f"❌\tERROR: Serializing sensitive field '{logger_name}.{key}'")
-                raise AttributeError(f"Invalid field name for serialization: '{logger_name}.{key}'")
 
-        # Recursively check nested dicts
-        if isinstance(value, dict):
-            _warn_sensitive_fields(cls, value)
-        elif isinstance(value, list):
-            for item in value:
-                if hasattr(item, "to_dict"):  # nested DTO object
-                    _warn_sensitive_fields(item, item.to_dict())
-                elif isinstance(item, dict):
-                    _warn_sensitive_fields(cls, item)
+def _check_sensitive_fields(entries, logger, logger_name, log_mode, sensitive_names, has_sensitive_suffix):
+    """
+    Walks ``(key, value)`` entries and the dicts and lists nested in them
+    without recursion, reporting sensitive keys in depth-first order. List
+    items are walked as entries with a None key.
+    """
+    # Stack of partially consumed iterators; each one resumes where it left off
+    stack = [iter(entries)]
+    push = stack.append
+    pop = stack.pop
+
+    while stack:
+        for key, value in stack[-1]:
+            if key.__class__ is str:
+                key_lower = key.lower()
+
+                # Warn if key matches known sensitive names or ends with sensitive suffix
+                if key_lower in sensitive_names or has_sensitive_suffix(key_lower):
+                    _report_sensitive_field(logger, logger_name, log_mode, key)
+
+            # Descend into nested dicts; nested DTOs are already serialized to dicts
+            value_type = value.__class__
+            if value_type is dict:
+                push(iter(value.items()))
+                break
+            if value_type is list:
+                push(zip(repeat(None), value))
+                break
+        else:
+            pop()
 
 
 def _remove_dataclass(cls):
@@ -243,16 +751,22 @@ def _remove_dataclass(cls):
         '__match_args__', '__dataclass_params__', '__dataclass_fields__'
     ]
 
+    # Default factories are not kept as class attributes, put them back for the rebuild
+    for cls_field in cls.__dataclass_fields__.values():
+        if cls_field.default_factory is not MISSING and cls_field.name not in cls.__dict__:
+            setattr(cls, cls_field.name, field(default_factory=cls_field.default_factory))
+
     for attr in dataclass_attrs:
-        if hasattr(cls, attr):
+        if attr in cls.__dict__:
             delattr(cls, attr)
     
     return cls
 
 def _is_api_dto(obj):
     cls = obj if isinstance(obj, type) else type(obj)
-    is_api_dto = hasattr(cls, _IS_API_DTO)
-    is_nullable_added = hasattr(cls, _NULLABLE_ADDED)
-    is_serializable_added = hasattr(cls, _SERIALIZABLE_ADDED)
+    # The markers are inherited on purpose: subclasses of a DTO count as DTOs
+    is_api_dto = getattr(cls, _IS_API_DTO, False)
+    is_nullable_added = getattr(cls, _NULLABLE_ADDED, False)
+    is_serializable_added = getattr(cls, _SERIALIZABLE_ADDED, False)
 
     return is_api_dto, is_nullable_added, is_serializable_added
\ No newline at end of file
@@ -1,11 +1,24 @@
 
+import re
+from operator import methodcaller
 from typing import Literal
 LogMode = Literal["warn", "strict"]
 
+# Above this many suffixes one compiled regex is faster than str.endswith(tuple)
+_SUFFIX_REGEX_THRESHOLD = 4
+
+def _suffix_matcher(suffixes):
+    """Returns a callable telling whether a string ends with one of the suffixes."""
+    if len(suffixes) > _SUFFIX_REGEX_THRESHOLD:
+        return re.compile("(?:" + "|".join(re.escape(suffix) for suffix in suffixes) + r")\Z").search
+    return methodcaller("endswith", suffixes)
+
 class SensitiveFields(object):
     log_mode: LogMode = 'warn'
     _SENSITIVE_SUFFIXES = ("_id", "_key")
+    _SENSITIVE_SUFFIX_MATCH = _suffix_matcher(_SENSITIVE_SUFFIXES)
     _SENSITIVE_FIELDS = ("api_key", "session_id", "password", "token")
+    _SENSITIVE_FIELDS_SET = frozenset(_SENSITIVE_FIELDS)
     _instance = None  # Class variable to store the single instance
     enabled = True
 
@@ -27,19 +40,25 @@ class SensitiveFields(object):
         if fields:
             if isinstance(fields, str):
                 fields = (fields,)
-            self._SENSITIVE_FIELDS = tuple(fields) if replace else tuple(set(self._SENSITIVE_FIELDS) | set(fields))
-        
+            self._SENSITIVE_FIELDS_SET = frozenset(fields) if replace else self._SENSITIVE_FIELDS_SET | frozenset(fields)
+            # Kept for introspection, lookups go through the set
+            self._SENSITIVE_FIELDS = tuple(self._SENSITIVE_FIELDS_SET)
+
         if suffixes:
             if isinstance(suffixes, str):
                 suffixes = (suffixes,)
             self._SENSITIVE_SUFFIXES = tuple(suffixes) if replace else tuple(set(self._SENSITIVE_SUFFIXES) | set(suffixes))
+            self._SENSITIVE_SUFFIX_MATCH = _suffix_matcher(self._SENSITIVE_SUFFIXES)
+
+# The singleton, for internal lookups; initialize() mutates it in place
+_SENSITIVE = SensitiveFields()
 
 def is_sensitive_field(value):
-    sensitive_fields = SensitiveFields()
+    sensitive_fields = _SENSITIVE
 
     if not sensitive_fields.enabled:
         return
     
-    if value in sensitive_fields._SENSITIVE_FIELDS or value.endswith(sensitive_fields._SENSITIVE_SUFFIXES):
+    if value in sensitive_fields._SENSITIVE_FIELDS_SET or sensitive_fields._SENSITIVE_SUFFIX_MATCH(value):
         return True
     return False
\ No newline at end of file
@@ -0,0 +1,17 @@
+import pytest
+
+from api_dto import SensitiveFields
+
+
+@pytest.fixture(autouse=True)
+def sensitive_fields():
+    """Restores the global sensitive-field settings after every test."""
+    sensitive_fields = SensitiveFields()
+    settings = dict(
+        enabled=sensitive_fields.enabled,
+        fields=sensitive_fields._SENSITIVE_FIELDS,
+        suffixes=sensitive_fields._SENSITIVE_SUFFIXES,
+        log_mode=sensitive_fields.log_mode,
+    )
+    yield sensitive_fields
+    sensitive_fields.initialize(replace=True, **settings)
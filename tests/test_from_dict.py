@@ -0,0 +1,235 @@
+import asyncio
+from enum import Enum
+from dataclasses import field
+from typing import Any, Optional
+
+import pytest
+from dacite import MissingValueError, WrongTypeError
+
+from api_dto import api_dto
+
+
+class Color(Enum):
+    RED = "r"
+    GREEN = "g"
+
+
+@api_dto
+class Address:
+    street: str
+    zip: int
+
+
+@api_dto
+class User:
+    id: int
+    name: str
+    score: float
+    color: Color
+    address: Address
+    addresses: list[Address]
+    tags: list[str]
+    counts: dict[str, int]
+    nick: Optional[str]
+    payload: dict
+    other: str = "default"
+
+
+@api_dto
+class Node:
+    name: str
+    children: list["Node"]
+
+
+@api_dto(optional=False)
+class Strict:
+    id: int
+    label: str = "x"
+    color: Color = Color.RED
+
+
+@api_dto(optional=False)
+class Nullable:
+    id: int | None
+    label: Optional[str]
+
+
+@api_dto
+class Computed:
+    x: int
+    y: int = field(default=3, init=False)
+
+
+@api_dto
+class Pair:
+    pair: tuple[int, int]
+
+
+@api_dto
+class Loose:
+    value: Any
+    items: Any = None
+    extra: object = "x"
+
+
+@api_dto
+class Flat:
+    id: int
+    name: str
+    tags: list
+
+
+class Request:
+    def __init__(self, data):
+        self.data = data
+
+    async def json(self):
+        return self.data
+
+
+def test_converts_fields():
+    user = User.from_dict({
+        "id": 1,
+        "name": "n",
+        "score": 1.5,
+        "color": "red",
+        "address": {"street": "s", "zip": 1},
+        "addresses": [{"street": "t", "zip": 2}],
+        "tags": ["a"],
+        "counts": {"a": 1},
+        "nick": None,
+        "payload": {"anything": [1, "2"]},
+    })
+
+    assert user == User(
+        id=1,
+        name="n",
+        score=1.5,
+        color=Color.RED,
+        address=Address(street="s", zip=1),
+        addresses=[Address(street="t", zip=2)],
+        tags=["a"],
+        counts={"a": 1},
+        nick=None,
+        payload={"anything": [1, "2"]},
+    )
+
+
+def test_fills_defaults_for_missing_keys():
+    user = User.from_dict({})
+
+    assert user.id is None
+    assert user.tags == []
+    assert user.counts == {}
+    assert user.other == "default"
+
+
+@pytest.mark.parametrize("value, member", [("r", Color.RED), ("GREEN", Color.GREEN), ("green", Color.GREEN)])
+def test_converts_enum_by_value_or_name(value, member):
+    assert User.from_dict({"color": value}).color is member
+
+
+def test_rejects_unknown_enum_value():
+    with pytest.raises(WrongTypeError) as error:
+        User.from_dict({"color": "purple"})
+
+    assert error.value.field_path == "color"
+
+
+def test_rejects_none_for_non_optional_enum():
+    with pytest.raises(WrongTypeError):
+        Strict.from_dict({"id": 1, "color": None})
+
+
+def test_converts_self_referencing_dto():
+    node = Node.from_dict({"name": "root", "children": [{"name": "leaf", "children": []}]})
+
+    assert node == Node(name="root", children=[Node(name="leaf", children=[])])
+
+
+def test_accepts_nested_dto_instance():
+    address = Address(street="s", zip=1)
+
+    assert User.from_dict({"address": address}).address is address
+
+
+@pytest.mark.parametrize("data, field_path", [
+    ({"id": "x"}, "id"),
+    ({"name": 5}, "name"),
+    ({"tags": [1, 2]}, "tags"),
+    ({"tags": "ab"}, "tags"),
+    ({"counts": {"a": "1"}}, "counts"),
+    ({"counts": [1]}, "counts"),
+    ({"payload": []}, "payload"),
+    ({"address": "s"}, "address"),
+    ({"addresses": "ab"}, "addresses"),
+    ({"addresses": 1}, "addresses"),
+    ({"address": {"zip": "1"}}, "address.zip"),
+    ({"addresses": [{"street": 1}]}, "addresses.street"),
+])
+def test_rejects_wrong_types(data, field_path):
+    with pytest.raises(WrongTypeError) as error:
+        User.from_dict(data)
+
+    assert error.value.field_path == field_path
+
+
+def test_accepts_int_for_float_field():
+    assert User.from_json('{"score": 10}').score == 10
+
+
+def test_rejects_none_for_non_optional_field():
+    with pytest.raises(WrongTypeError):
+        Strict.from_dict({"id": None})
+
+
+def test_missing_required_field():
+    with pytest.raises(MissingValueError):
+        Strict.from_dict({})
+
+    assert Strict.from_dict({"id": 1}) == Strict(id=1, label="x", color=Color.RED)
+
+
+def test_missing_optional_field_defaults_to_none():
+    assert Nullable.from_dict({}) == Nullable(id=None, label=None)
+
+
+def test_sets_init_false_fields_from_data():
+    assert Computed.from_dict({"x": 1, "y": 5}).y == 5
+    assert Computed.from_dict({"x": 1}).y == 3
+
+    with pytest.raises(WrongTypeError) as error:
+        Computed.from_dict({"y": "5"})
+
+    assert error.value.field_path == "y"
+
+
+def test_unsupported_types_fall_back_to_dacite():
+    assert Pair.from_dict({"pair": (1, 2)}) == Pair(pair=(1, 2))
+
+    with pytest.raises(WrongTypeError):
+        Pair.from_dict({"pair": "ab"})
+
+
+def test_from_json_and_http_request():
+    assert Address.from_json('{"street": "s", "zip": 1}') == Address(street="s", zip=1)
+    assert asyncio.run(Address.from_http_request(Request({"zip": 2}))) == Address(zip=2)
+
+    with pytest.raises(WrongTypeError):
+        asyncio.run(Address.from_http_request(Request({"zip": "2"})))
+
+
+def test_unconstrained_fields_are_passed_through():
+    assert Loose.from_dict({"value": {"a": 1}, "ignored": 1}) == Loose(value={"a": 1}, items=None, extra="x")
+    assert Loose.from_dict({}) == Loose(value=None)
+
+
+def test_primitive_only_dto_checks_types():
+    assert Flat.from_dict({"id": 1, "tags": ["a"]}) == Flat(id=1, name=None, tags=["a"])
+    assert Flat.from_dict({}).tags == []
+
+    for data, field_path in [({"id": "1"}, "id"), ({"tags": "ab"}, "tags")]:
+        with pytest.raises(WrongTypeError) as error:
+            Flat.from_dict(data)
+
+        assert error.value.field_path == field_path
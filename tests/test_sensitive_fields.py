@@ -0,0 +1,84 @@
+import logging
+
+import pytest
+
+from api_dto import api_dto, is_sensitive_field
+
+
+@api_dto
+class Credentials:
+    password: str
+
+
+@api_dto
+class Account:
+    count: int
+    account_id: int
+    name: str
+    credentials: Credentials
+    history: list[Credentials]
+    extra: dict
+
+
+def warned_fields(caplog):
+    return [record.getMessage().rsplit("'", 2)[1] for record in caplog.records]
+
+
+def test_warns_on_sensitive_fields(caplog):
+    account = Account(
+        account_id=1,
+        credentials=Credentials(password="a"),
+        history=[Credentials(password="b")],
+        extra={"nested": [{"token": "c"}]},
+    )
+
+    with caplog.at_level(logging.WARNING):
+        account.to_dict()
+
+    assert warned_fields(caplog) == [
+        "Account.account_id",
+        "Account.password",
+        "Account.password",
+        "Account.token",
+    ]
+
+
+def test_checks_nested_data_in_fields_declared_atomic(sensitive_fields):
+    sensitive_fields.initialize(log_mode="strict")
+
+    with pytest.raises(AttributeError):
+        Account(count={"password": "hunter2"}).to_dict()
+
+
+def test_strict_mode_raises(sensitive_fields):
+    sensitive_fields.initialize(log_mode="strict")
+
+    with pytest.raises(AttributeError):
+        Credentials(password="a").to_dict()
+
+
+def test_disabled_skips_checks(sensitive_fields, caplog):
+    sensitive_fields.initialize(enabled=False, log_mode="strict")
+
+    assert Credentials(password="a").to_dict() == {"password": "a"}
+    assert not caplog.records
+
+
+def test_reconfiguring_applies_to_decorated_classes(sensitive_fields, caplog):
+    Account(name="n").to_dict()
+    sensitive_fields.initialize(fields=["name"])
+
+    with caplog.at_level(logging.WARNING):
+        Account(name="n").to_dict()
+
+    assert "Account.name" in warned_fields(caplog)
+
+
+@pytest.mark.parametrize("suffixes", [("_x",), ("_a", "_b", "_c", "_d", "_x")])
+def test_is_sensitive_field(sensitive_fields, suffixes):
+    sensitive_fields.initialize(suffixes=suffixes)
+
+    assert is_sensitive_field("password")
+    assert is_sensitive_field("user_id")
+    assert is_sensitive_field("value_x")
+    assert not is_sensitive_field("value_y")
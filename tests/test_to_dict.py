@@ -0,0 +1,116 @@
+import json
+from collections import OrderedDict, defaultdict
+from dataclasses import asdict, field
+from enum import Enum
+from typing import Any, NamedTuple
+
+import pytest
+
+from api_dto import api_dto
+
+
+class Color(Enum):
+    RED = "r"
+
+
+@api_dto
+class Inner:
+    value: int
+
+
+@api_dto
+class Outer:
+    x: int
+    _priv: int = 5
+    y: int = field(default=3, init=False)
+    color: Color = None
+    inner: Inner = None
+    inners: list[Inner] = None
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+class Items(list):
+    pass
+
+
+@api_dto
+class Containers:
+    ordered: dict[str, int]
+    defaults: Any
+    items: list[int]
+    nested: Any
+    point: Any
+
+
+def test_to_dict_serializes_nested_dtos():
+    outer = Outer(x=1, color=Color.RED, inner=Inner(value=2), inners=[Inner(value=3)])
+
+    assert outer.to_dict() == {
+        "x": 1,
+        "_priv": 5,
+        "y": 3,
+        "color": Color.RED,
+        "inner": {"value": 2},
+        "inners": [{"value": 3}],
+    }
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_to_json_matches_to_dict(sensitive_fields, enabled):
+    sensitive_fields.initialize(enabled=enabled)
+    outer = Outer(x=1, color=Color.RED)
+    outer.runtime_attr = "leak"
+
+    assert json.loads(outer.to_json()) == {
+        "x": 1,
+        "_priv": 5,
+        "y": 3,
+        "color": "r",
+        "inner": None,
+        "inners": None,
+    }
+
+
+def test_to_dict_keeps_container_subclasses_like_asdict():
+    containers = Containers(
+        ordered=OrderedDict(a=1),
+        items=Items([1, 2]),
+        nested=(Inner(value=2), [Inner(value=3)]),
+        point=Point(1, 2),
+    )
+
+    data = containers.to_dict()
+
+    assert data == asdict(containers)
+    assert type(data["ordered"]) is OrderedDict
+    assert type(data["items"]) is Items
+    assert type(data["point"]) is Point
+    assert data["items"] is not containers.items
+
+
+def test_to_dict_keeps_defaultdict_factory():
+    # asdict only handles defaultdict from Python 3.12 on
+    data = Containers(defaults=defaultdict(list, a=[Inner(value=1)])).to_dict()
+
+    assert type(data["defaults"]) is defaultdict
+    assert data["defaults"].default_factory is list
+    assert data["defaults"] == {"a": [{"value": 1}]}
+
+
+@pytest.mark.parametrize("payload", [
+    {"text": "é", "color": Color.RED, "point": Point(1, 2), "items": [1.5, None, True], 1: "x"},
+    {"big": 2**70, "items": [-(2**70)]},
+])
+def test_json_backends_encode_the_same(payload):
+    pytest.importorskip("orjson")
+    from api_dto.api_dto import _dumps, _json_dumps
+
+    assert _dumps(payload) == _json_dumps(payload)
+
+
+def test_to_json_encodes_big_ints():
+    assert json.loads(Inner(value=2**70).to_json()) == {"value": 2**70}